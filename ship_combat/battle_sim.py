@@ -6,30 +6,41 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import logging
 import random
 import math
-from typing import List
+import sys
+from typing import Dict, List, Optional, Tuple
 
-from .models import Ship
+import numpy as np
+
+from .models import RANGE_BANDS, Ship, WeaponBattery
 from .fleet_setup import demo_fleets
+from .dice import parse_dice, roll
+from .fleet_arrays import Engagement, FleetArrays, battery_table
+
+# named explicitly so the logger is the same when run with `python -m`
+log = logging.getLogger("ship_combat.battle_sim")
 
 try:
     import rolldice  # type: ignore
 except Exception:  # rolldice may not be installed in Pyodide yet
     rolldice = None  # will be loaded dynamically
 
-BATTLE_ORDERS = [
-    "Brace for Impact",
-    "Lock On",
-    "All Power to Shields",
-    "Reload Ordnance",
-    "Boarding Party",
-    "Fire Everything",
-    "Combat Repairs",
-    "Disengage",
-    "Offensive Maneuvers",
-    "Run Silent",
-]
+# (attack_mod, defense_mod, repair_priority) granted by each order
+ORDER_EFFECTS: Dict[str, Tuple[int, int, bool]] = {
+    "Brace for Impact": (0, 2, False),
+    "Lock On": (2, 0, False),
+    "All Power to Shields": (0, 1, False),
+    "Reload Ordnance": (0, 0, False),
+    "Boarding Party": (0, 0, False),
+    "Fire Everything": (1, 0, False),
+    "Combat Repairs": (0, 1, True),
+    "Disengage": (-2, 1, False),
+    "Offensive Maneuvers": (1, -1, False),
+    "Run Silent": (-1, 1, False),
+}
+BATTLE_ORDERS = tuple(ORDER_EFFECTS)
 
 HAZARDS = {
     "System Failure": "Random system takes damage",
@@ -38,14 +49,13 @@ HAZARDS = {
     "Nebula": "Sensors obscured, -1 attack",
     "Radiation Burst": "All systems lose efficiency",
 }
+HAZARD_KEYS = tuple(HAZARDS)
 
-# simple mapping of range bands to maximum distance units
-RANGE_BANDS = {
-    "point": 5.0,
-    "short": 10.0,
-    "standard": 20.0,
-    "long": 40.0,
-}
+# squared range limits for missile launches and boarding actions
+LONG_RANGE_SQ = RANGE_BANDS["long"] ** 2
+POINT_RANGE_SQ = RANGE_BANDS["point"] ** 2
+# the furthest any battery or missile can reach
+MAX_REACH_SQ = max(RANGE_BANDS.values()) ** 2
 
 
 # orientation helper functions
@@ -84,12 +94,22 @@ def in_arc(ship: Ship, target: Ship, arc: str) -> bool:
 def in_range(ship: Ship, target: Ship, rng: str) -> bool:
     """Return True if target is within the range band."""
     max_dist = RANGE_BANDS.get(rng, RANGE_BANDS["standard"])
-    return distance(ship, target) <= max_dist
+    return distance_sq(ship, target) <= max_dist * max_dist
 
 
-def can_fire(ship: Ship, target: Ship, battery) -> bool:
+def can_fire(ship: Ship, target: Ship, battery: WeaponBattery) -> bool:
     """Determine if a weapon battery can fire at the given target."""
-    return in_range(ship, target, battery.range) and in_arc(ship, target, battery.arc)
+    return distance_sq(ship, target) <= battery._max_dist_sq and in_arc(
+        ship, target, battery.arc
+    )
+
+
+def distance_sq(a: Ship, b: Ship) -> float:
+    """Squared Euclidean distance between two ships, for range checks."""
+    dx = a.x - b.x
+    dy = a.y - b.y
+    dz = a.z - b.z
+    return dx * dx + dy * dy + dz * dz
 
 
 def distance(a: Ship, b: Ship) -> float:
@@ -102,12 +122,23 @@ def distance(a: Ship, b: Ship) -> float:
 
 def move_fleet(fleet: List[Ship]) -> None:
     """Advance each ship based on its speed and heading."""
+    # trig only needs redoing for ships whose heading or pitch changed
+    stale = [s for s in fleet if s._course[:2] != (s.heading, s.pitch)]
+    if stale:
+        fa = FleetArrays.from_ships(stale)
+        yaw_rad = np.deg2rad(fa.heading)
+        pitch_rad = np.deg2rad(fa.pitch)
+        cos_pitch = np.cos(pitch_rad)
+        ux = (np.cos(yaw_rad) * cos_pitch).tolist()
+        uy = (np.sin(yaw_rad) * cos_pitch).tolist()
+        uz = np.sin(pitch_rad).tolist()
+        for ship, course in zip(stale, zip(ux, uy, uz)):
+            ship._course = (ship.heading, ship.pitch) + course
     for ship in fleet:
-        yaw_rad = math.radians(ship.heading)
-        pitch_rad = math.radians(ship.pitch)
-        ship.x += math.cos(yaw_rad) * math.cos(pitch_rad) * ship.speed
-        ship.y += math.sin(yaw_rad) * math.cos(pitch_rad) * ship.speed
-        ship.z += math.sin(pitch_rad) * ship.speed
+        _, _, ux, uy, uz = ship._course
+        ship.x += ux * ship.speed
+        ship.y += uy * ship.speed
+        ship.z += uz * ship.speed
 
 
 async def install_dependencies() -> None:
@@ -125,179 +156,325 @@ async def install_dependencies() -> None:
     rolldice = _rolldice
 
 
+def seed_rng(seed: Optional[int] = None) -> None:
+    """Seed the random stream shared by orders, hazards and all dice rolls.
+
+    Every draw in the simulator (including the rolldice fallback) comes from
+    the ``random`` module's generator, so one seed reproduces a whole battle.
+    """
+    random.seed(seed)
+
+
+def roll_dice(notation: str) -> int:
+    """Roll a dice expression, using rolldice only for non-trivial notation."""
+    parsed = parse_dice(notation)
+    if parsed is not None:
+        return roll(*parsed)
+    if rolldice is None:
+        raise RuntimeError("rolldice not loaded")
+    result, _ = rolldice.roll_dice(notation)
+    return int(result)
+
+
+def roll_damage(battery: WeaponBattery) -> int:
+    """Roll damage for a battery using its pre-parsed dice when available."""
+    if battery._count:
+        return roll(battery._count, battery._sides)
+    return roll_dice(battery.damage_dice)
+
+
 # ---------------- Battle Phases -----------------
 
 
+def _engagement(
+    attacking: List[Ship], defending: List[Ship], engagement: Optional[Engagement]
+) -> Engagement:
+    """Return the supplied engagement or compute one for the two fleets."""
+    if engagement is not None:
+        return engagement
+    return Engagement.between(
+        FleetArrays.from_ships(attacking), FleetArrays.from_ships(defending)
+    )
+
+
+def _within_reach(
+    attacking: List[Ship], defending: List[Ship], reach_sq: float
+) -> bool:
+    """False when no attacker can be within ``reach_sq`` of any defender.
+
+    Compares the two fleets' bounding boxes, so it costs one pass over the
+    ships and never rules out a pair that is actually in reach.
+    """
+    if not attacking or not defending:
+        return False
+    gap_sq = 0.0
+    for axis in ("x", "y", "z"):
+        a = [getattr(s, axis) for s in attacking]
+        d = [getattr(s, axis) for s in defending]
+        gap = max(min(d) - max(a), min(a) - max(d), 0.0)
+        gap_sq += gap * gap
+    return gap_sq <= reach_sq
+
+
+def _alive_mask(ships: List[Ship]) -> np.ndarray:
+    """Boolean mask of ships with hull remaining."""
+    return np.fromiter((s.hull > 0 for s in ships), dtype=bool, count=len(ships))
+
+
+def _nearest_alive(dist: np.ndarray, alive: np.ndarray) -> List[int]:
+    """Closest living defender for every attacker row, or -1 if none are left."""
+    if not alive.any():
+        return [-1] * len(dist)
+    return np.argmin(np.where(alive, dist, np.inf), axis=1).tolist()
+
+
 def select_orders(fleet: List[Ship]) -> None:
     """Randomly assign orders to each ship."""
+    choice = random.choice
     for ship in fleet:
-        ship.order = random.choice(BATTLE_ORDERS)
-        ship.attack_mod = 0
-        ship.defense_mod = 0
-        ship.repair_priority = False
-        if ship.order == "Lock On":
-            ship.attack_mod += 2
-        elif ship.order == "Brace for Impact":
-            ship.defense_mod += 2
-        elif ship.order == "Fire Everything":
-            ship.attack_mod += 1
-        elif ship.order == "All Power to Shields":
-            ship.defense_mod += 1
-        elif ship.order == "Combat Repairs":
-            ship.repair_priority = True
-            ship.defense_mod += 1
-        elif ship.order == "Disengage":
-            ship.attack_mod -= 2
-            ship.defense_mod += 1
-        elif ship.order == "Offensive Maneuvers":
-            ship.attack_mod += 1
-            ship.defense_mod -= 1
-        elif ship.order == "Run Silent":
-            ship.attack_mod -= 1
-            ship.defense_mod += 1
-        print(f"{ship.name} selects order: {ship.order}")
+        order = choice(BATTLE_ORDERS)
+        ship.order = order
+        ship.attack_mod, ship.defense_mod, ship.repair_priority = ORDER_EFFECTS[order]
+        log.info("%s selects order: %s", ship.name, ship.order)
 
 
 def apply_hazard(ship: Ship, hazard: str) -> None:
     """Apply a named hazard effect to a single ship."""
-    if rolldice is None:
-        raise RuntimeError("rolldice not loaded")
     if hazard == "System Failure":
-        system_name = random.choice(list(ship.systems.keys()))
-        ship.systems[system_name].damage(10)
-        print(
-            f"Hazard damages {ship.name}'s {system_name}, now {ship.systems[system_name].efficiency}%"
+        system_name, system = random.choice(tuple(ship.systems.items()))
+        system.damage(10)
+        log.info(
+            "Hazard damages %s's %s, now %s%%",
+            ship.name,
+            system_name,
+            system.efficiency,
         )
     elif hazard == "Gravity Well":
         ship.attack_mod -= 1
         ship.defense_mod -= 1
-        print(f"{ship.name} caught in gravity well: -1 attack and defense")
+        log.info("%s caught in gravity well: -1 attack and defense", ship.name)
     elif hazard == "Minefield":
-        dmg, _ = rolldice.roll_dice("1d6")
-        ship.hull = max(0, ship.hull - int(dmg))
-        print(f"{ship.name} strikes a mine for {dmg} damage (hull {ship.hull})")
+        dmg = roll_dice("1d6")
+        ship.hull = max(0, ship.hull - dmg)
+        log.info(
+            "%s strikes a mine for %s damage (hull %s)", ship.name, dmg, ship.hull
+        )
     elif hazard == "Nebula":
         ship.attack_mod -= 1
-        print(f"{ship.name} enters nebula: -1 attack this round")
+        log.info("%s enters nebula: -1 attack this round", ship.name)
     elif hazard == "Radiation Burst":
         for system in ship.systems.values():
             system.damage(5)
-        print(f"{ship.name} hit by radiation burst: all systems degrade")
+        log.info("%s hit by radiation burst: all systems degrade", ship.name)
 
 
 def resolve_hazards(fleet: List[Ship]) -> None:
     """Randomly apply environmental hazards."""
+    rand = random.random
+    choice = random.choice
     for ship in fleet:
         if not ship.systems:
             continue
-        if random.random() < 0.1:
-            hazard = random.choice(list(HAZARDS.keys()))
-            print(f"{ship.name} encounters hazard: {hazard}")
+        if rand() < 0.1:
+            hazard = choice(HAZARD_KEYS)
+            log.info("%s encounters hazard: %s", ship.name, hazard)
             apply_hazard(ship, hazard)
 
 
-def shooting_phase(attacking: List[Ship], defending: List[Ship]) -> None:
+def _resolve_shots(
+    attack_mod: int,
+    defense_target: int,
+    hull: int,
+    batteries: List[WeaponBattery],
+) -> Tuple[int, List[Tuple[WeaponBattery, Optional[int], int]]]:
+    """Roll a volley of batteries against one target without logging.
+
+    Returns the target's remaining hull and one ``(battery, damage, hull)``
+    entry per shot, with ``damage`` None for a miss. The volley stops as soon
+    as the target's hull reaches zero.
+    """
+    shots: List[Tuple[WeaponBattery, Optional[int], int]] = []
+    for battery in batteries:
+        if roll(2, 20) + attack_mod + battery.accuracy > defense_target:
+            dmg = roll_damage(battery)
+            hull = max(0, hull - dmg)
+            shots.append((battery, dmg, hull))
+            if hull == 0:
+                break
+        else:
+            shots.append((battery, None, hull))
+    return hull, shots
+
+
+def shooting_phase(
+    attacking: List[Ship],
+    defending: List[Ship],
+    engagement: Optional[Engagement] = None,
+) -> None:
     """Resolve shooting between fleets."""
-    if rolldice is None:
-        raise RuntimeError("rolldice not loaded")
-    for ship in attacking:
+    engagement = _engagement(attacking, defending, engagement)
+    nearest_first = np.argsort(engagement.dist, axis=1, kind="stable")
+    fitted = {
+        b._arc_code for s in attacking if s.hull > 0 for b in s.weapons.batteries
+    }
+    arc_masks = engagement.arc_masks(fitted)
+    dist_sq = engagement.dist_sq
+    verbose = log.isEnabledFor(logging.INFO)
+    # defenders only die to our own shots here, so track kills locally
+    alive = _alive_mask(defending)
+    for i, ship in enumerate(attacking):
         if ship.hull <= 0:
             continue
-        targets = [t for t in defending if t.hull > 0]
-        targets.sort(key=lambda t: distance(ship, t))
-        if not targets:
+        arc_codes, max_dist_sq = battery_table(ship.weapons)
+        # fireable[b, j]: battery b has defender j in arc and in range
+        fireable = arc_masks[arc_codes, i] & (dist_sq[i] <= max_dist_sq[:, None])
+        ranked = nearest_first[i]
+        engageable = (fireable.any(axis=0) & alive)[ranked]
+        if not engageable.any():
             continue
-        chosen = None
-        valid_batteries = []
-        for tgt in targets:
-            bats = [b for b in ship.weapons.batteries if can_fire(ship, tgt, b)]
-            if bats:
-                chosen = tgt
-                valid_batteries = bats
-                break
-        if not chosen:
-            continue
-        for battery in valid_batteries:
-            roll, _ = rolldice.roll_dice("2d20")
-            attack_total = roll + ship.attack_mod + battery.accuracy
-            defense_target = chosen.shield + chosen.defense_mod
-            if attack_total > defense_target:
-                dmg, _ = rolldice.roll_dice(battery.damage_dice)
-                chosen.hull = max(0, chosen.hull - int(dmg))
-                print(
-                    f"{ship.name} hits {chosen.name} with {battery.name} for {dmg} (hull {chosen.hull})"
-                )
-                if chosen.hull == 0:
-                    print(f"{chosen.name} destroyed!")
-                    break
-            else:
-                print(f"{ship.name} misses {chosen.name} with {battery.name}")
-
-
-def missile_phase(attacking: List[Ship], defending: List[Ship]) -> None:
+        chosen_idx = int(ranked[engageable.argmax()])
+        chosen = defending[chosen_idx]
+        batteries = ship.weapons.batteries
+        valid_batteries = [
+            batteries[b] for b in np.flatnonzero(fireable[:, chosen_idx]).tolist()
+        ]
+        hull, shots = _resolve_shots(
+            ship.attack_mod,
+            chosen.shield + chosen.defense_mod,
+            chosen.hull,
+            valid_batteries,
+        )
+        chosen.hull = hull
+        if verbose:
+            for battery, dmg, remaining in shots:
+                if dmg is None:
+                    log.info(
+                        "%s misses %s with %s", ship.name, chosen.name, battery.name
+                    )
+                else:
+                    log.info(
+                        "%s hits %s with %s for %s (hull %s)",
+                        ship.name,
+                        chosen.name,
+                        battery.name,
+                        dmg,
+                        remaining,
+                    )
+        if hull == 0:
+            alive[chosen_idx] = False
+            log.info("%s destroyed!", chosen.name)
+
+
+def missile_phase(
+    attacking: List[Ship],
+    defending: List[Ship],
+    engagement: Optional[Engagement] = None,
+) -> None:
     """Fire missiles if available."""
-    if rolldice is None:
-        raise RuntimeError("rolldice not loaded")
-    for ship in attacking:
+    engagement = _engagement(attacking, defending, engagement)
+    alive = _alive_mask(defending)
+    # nearest targets only change when a defender is destroyed
+    nearest = _nearest_alive(engagement.dist, alive)
+    for i, ship in enumerate(attacking):
         if ship.weapons.missiles <= 0 or ship.hull <= 0:
             continue
-        targets = [t for t in defending if t.hull > 0]
-        if not targets:
+        j = nearest[i]
+        if j < 0:
             continue
-        target = min(targets, key=lambda t: distance(ship, t))
-        if not in_range(ship, target, "long"):
+        if engagement.dist_sq[i, j] > LONG_RANGE_SQ:
             continue
+        target = defending[j]
         ship.weapons.missiles -= 1
-        dmg, _ = rolldice.roll_dice("3d6")
-        target.hull = max(0, target.hull - int(dmg))
-        print(
-            f"{ship.name} launches missile at {target.name} for {dmg} (hull {target.hull})"
+        dmg = roll_dice("3d6")
+        target.hull = max(0, target.hull - dmg)
+        log.info(
+            "%s launches missile at %s for %s (hull %s)",
+            ship.name,
+            target.name,
+            dmg,
+            target.hull,
         )
         if target.hull == 0:
-            print(f"{target.name} destroyed by missile!")
+            alive[j] = False
+            nearest = _nearest_alive(engagement.dist, alive)
+            log.info("%s destroyed by missile!", target.name)
 
 
-def boarding_phase(attacking: List[Ship], defending: List[Ship]) -> None:
-    """Attempt boarding actions."""
-    if rolldice is None:
-        raise RuntimeError("rolldice not loaded")
+def _roll_boarding_launches(attacking: List[Ship]) -> None:
+    """Draw the launch rolls of ships that have no target in boarding range.
+
+    Nothing can be boarded, but the dice are still consumed so a seeded
+    battle follows the same random sequence either way.
+    """
+    rand = random.random
     for ship in attacking:
+        if ship.hull > 0:
+            rand()
+
+
+def boarding_phase(
+    attacking: List[Ship],
+    defending: List[Ship],
+    engagement: Optional[Engagement] = None,
+) -> None:
+    """Attempt boarding actions."""
+    if engagement is None and not _within_reach(
+        attacking, defending, POINT_RANGE_SQ
+    ):
+        _roll_boarding_launches(attacking)
+        return
+    engagement = _engagement(attacking, defending, engagement)
+    alive = _alive_mask(defending)
+    nearest = _nearest_alive(engagement.dist, alive)
+    rand = random.random
+    for i, ship in enumerate(attacking):
         if ship.hull <= 0:
             continue
-        if random.random() < 0.2:  # 20% chance to board
-            targets = [t for t in defending if t.hull > 0]
-            if not targets:
+        if rand() < 0.2:  # 20% chance to board
+            j = nearest[i]
+            if j < 0:
                 continue
-            target = min(targets, key=lambda t: distance(ship, t))
-            if not in_range(ship, target, "point"):
+            if engagement.dist_sq[i, j] > POINT_RANGE_SQ:
                 continue
-            atk, _ = rolldice.roll_dice("1d20")
+            target = defending[j]
+            atk = roll_dice("1d20")
             attack_total = atk + ship.boarding_strength + ship.attack_mod
             defend_total = target.boarding_strength + target.defense_mod
             if attack_total > defend_total:
-                dmg, _ = rolldice.roll_dice("1d10")
-                target.hull = max(0, target.hull - int(dmg))
-                print(
-                    f"{ship.name} boards {target.name} for {dmg} damage (hull {target.hull})"
+                dmg = roll_dice("1d10")
+                target.hull = max(0, target.hull - dmg)
+                log.info(
+                    "%s boards %s for %s damage (hull %s)",
+                    ship.name,
+                    target.name,
+                    dmg,
+                    target.hull,
                 )
                 if target.hull == 0:
-                    print(f"{target.name} captured and destroyed!")
+                    alive[j] = False
+                    nearest = _nearest_alive(engagement.dist, alive)
+                    log.info("%s captured and destroyed!", target.name)
             else:
-                print(f"{ship.name} fails to board {target.name}")
+                log.info("%s fails to board %s", ship.name, target.name)
 
 
 def repair_phase(fleet: List[Ship]) -> None:
     """Attempt simple repairs on damaged systems."""
-    if rolldice is None:
-        raise RuntimeError("rolldice not loaded")
+    rand = random.random
+    choice = random.choice
     for ship in fleet:
-        damaged = [s for s in ship.systems.values() if s.status != "Operational"]
+        damaged = ship.damaged_systems()
+        if not damaged:
+            continue
         chance = 1.0 if ship.repair_priority else 0.5
-        if damaged and random.random() < chance:
-            system = random.choice(damaged)
+        if rand() < chance:
+            system = choice(damaged)
             system.repair(10)
-            print(
-                f"{ship.name} repairs {system.effect or 'a system'} to {system.efficiency}%"
+            log.info(
+                "%s repairs %s to %s%%",
+                ship.name,
+                system.effect or "a system",
+                system.efficiency,
             )
 
 
@@ -305,17 +482,30 @@ def repair_phase(fleet: List[Ship]) -> None:
 
 
 def run_round(fleet_a: List[Ship], fleet_b: List[Ship], round_num: int) -> None:
-    print(f"\n=== ROUND {round_num} ===")
-    select_orders(fleet_a + fleet_b)
-    resolve_hazards(fleet_a + fleet_b)
-    move_fleet(fleet_a + fleet_b)
-    shooting_phase(fleet_a, fleet_b)
-    shooting_phase(fleet_b, fleet_a)
-    missile_phase(fleet_a, fleet_b)
-    missile_phase(fleet_b, fleet_a)
-    boarding_phase(fleet_a, fleet_b)
-    boarding_phase(fleet_b, fleet_a)
-    repair_phase(fleet_a + fleet_b)
+    log.info("\n=== ROUND %s ===", round_num)
+    combined = fleet_a + fleet_b
+    select_orders(combined)
+    resolve_hazards(combined)
+    move_fleet(combined)
+    if _within_reach(fleet_a, fleet_b, MAX_REACH_SQ):
+        # positions are fixed for the rest of the round: compute every
+        # pairwise distance and angle once and hand each side a view of it
+        fleet = FleetArrays.from_ships(combined)
+        geometry = Engagement.between(fleet, fleet)
+        split = len(fleet_a)
+        a_to_b = geometry.block(slice(None, split), slice(split, None))
+        b_to_a = geometry.block(slice(split, None), slice(None, split))
+        shooting_phase(fleet_a, fleet_b, a_to_b)
+        shooting_phase(fleet_b, fleet_a, b_to_a)
+        missile_phase(fleet_a, fleet_b, a_to_b)
+        missile_phase(fleet_b, fleet_a, b_to_a)
+        boarding_phase(fleet_a, fleet_b, a_to_b)
+        boarding_phase(fleet_b, fleet_a, b_to_a)
+    else:
+        # nothing can shoot, launch or board this round
+        _roll_boarding_launches(fleet_a)
+        _roll_boarding_launches(fleet_b)
+    repair_phase(combined)
 
 
 def battle(fleet_a: List[Ship], fleet_b: List[Ship], rounds: int = 3) -> None:
@@ -327,14 +517,47 @@ def battle(fleet_a: List[Ship], fleet_b: List[Ship], rounds: int = 3) -> None:
         fleet_b = [s for s in fleet_b if s.hull > 0]
         if not fleet_a or not fleet_b:
             break
-    print("\n--- Battle Over ---")
+    log.info("\n--- Battle Over ---")
     for ship in fleet_a + fleet_b:
         status = "DESTROYED" if ship.hull <= 0 else f"Hull {ship.hull}"
-        print(f"{ship.name}: {status}")
+        log.info("%s: %s", ship.name, status)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler that writes to whatever ``sys.stdout`` currently is.
+
+    PyScript and notebooks swap ``sys.stdout`` after import, so the stream
+    is looked up on every emit rather than bound once.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
 
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
 
-async def main_async(rounds: int) -> None:
+
+def configure_logging(quiet: bool = False) -> None:
+    """Print the battle log to stdout, or only warnings when ``quiet``.
+
+    The log stops propagating to the root logger, so a host that has also
+    configured root logging does not print every line twice.
+    """
+    logger = logging.getLogger("ship_combat")
+    if not any(isinstance(h, _StdoutHandler) for h in logger.handlers):
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+
+
+async def main_async(rounds: int, seed: Optional[int] = None) -> None:
     await install_dependencies()
+    if seed is not None:
+        seed_rng(seed)
     fleet_a, fleet_b = demo_fleets()
     battle(fleet_a, fleet_b, rounds)
 
@@ -344,8 +567,15 @@ def main() -> None:
     parser.add_argument(
         "--rounds", type=int, default=3, help="Number of rounds to simulate"
     )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Suppress the round-by-round battle log"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for a reproducible battle"
+    )
     args = parser.parse_args()
-    asyncio.run(main_async(args.rounds))
+    configure_logging(args.quiet)
+    asyncio.run(main_async(args.rounds, args.seed))
 
 
 if __name__ == "__main__":
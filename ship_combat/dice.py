@@ -0,0 +1,33 @@
+# Fast dice helpers for plain NdS notation.
+# rolldice runs every expression through a full regex-driven parser; the
+# battle phases only ever roll simple NdS groups, so these are parsed once
+# and rolled directly. Dice are drawn with random.randint in the same order
+# rolldice uses, so seeded battles replay identically on either path.
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def parse_dice(notation: str) -> Optional[Tuple[int, int]]:
+    """Return ``(count, sides)`` for plain ``NdS`` notation, else None."""
+    count, sep, sides = notation.strip().lower().partition("d")
+    if not sep or not sides.isdigit() or (count and not count.isdigit()):
+        return None
+    n_dice = int(count) if count else 1
+    die_size = int(sides)
+    if n_dice <= 0 or die_size <= 0:
+        return None
+    return n_dice, die_size
+
+
+def roll(count: int, sides: int) -> int:
+    """Roll ``count`` dice with ``sides`` faces and return the total."""
+    randint = random.randint
+    total = 0
+    for _ in range(count):
+        total += randint(1, sides)
+    return total
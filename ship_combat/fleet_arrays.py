@@ -0,0 +1,132 @@
+# Structure-of-arrays view of a fleet.
+# Ship dataclasses remain the source of truth; FleetArrays gathers their
+# numeric fields into NumPy columns so fleet-wide work (movement, pairwise
+# geometry) runs as array operations instead of per-ship attribute lookups.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import ARCS, Ship, WeaponSystem
+
+
+@dataclass
+class FleetArrays:
+    """Column-oriented snapshot of a list of ships."""
+
+    ships: List[Ship]
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    heading: np.ndarray
+    pitch: np.ndarray
+
+    @classmethod
+    def from_ships(cls, ships: Sequence[Ship]) -> "FleetArrays":
+        """Build the columns from a sequence of ships."""
+        ships = list(ships)
+        return cls(
+            ships=ships,
+            x=np.array([s.x for s in ships], dtype=np.float64),
+            y=np.array([s.y for s in ships], dtype=np.float64),
+            z=np.array([s.z for s in ships], dtype=np.float64),
+            heading=np.array([s.heading for s in ships], dtype=np.float64),
+            pitch=np.array([s.pitch for s in ships], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ships)
+
+
+def battery_table(weapons: WeaponSystem) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(arc_codes, max_dist_sq)`` arrays for a ship's batteries.
+
+    A weapon fit rarely changes during a battle, so the arrays are built
+    once and cached on the WeaponSystem until ``add_battery()`` is called.
+    """
+    if weapons._table is None:
+        weapons._table = (
+            np.array([b._arc_code for b in weapons.batteries], dtype=np.intp),
+            np.array([b._max_dist_sq for b in weapons.batteries], dtype=np.float64),
+        )
+    return weapons._table
+
+
+@dataclass
+class Engagement:
+    """Pairwise geometry from every attacker to every defender.
+
+    Row ``i`` describes attacker ``i`` and column ``j`` defender ``j``;
+    ``bearing`` is the absolute yaw towards the defender (0-360) and
+    ``elevation`` the angle above the attacker's horizontal plane.
+    ``heading``/``pitch`` are the attackers' own orientation, the only
+    per-ship columns the arc tests need. Positions do not change during
+    the combat phases, so one Engagement built after movement is shared by
+    shooting, missiles and boarding.
+    """
+
+    heading: np.ndarray
+    pitch: np.ndarray
+    dist_sq: np.ndarray
+    dist: np.ndarray
+    bearing: np.ndarray
+    elevation: np.ndarray
+
+    @classmethod
+    def between(cls, attackers: FleetArrays, defenders: FleetArrays) -> "Engagement":
+        """Compute the attacker x defender geometry in one broadcast."""
+        dx = defenders.x[None, :] - attackers.x[:, None]
+        dy = defenders.y[None, :] - attackers.y[:, None]
+        dz = defenders.z[None, :] - attackers.z[:, None]
+        dist_sq = dx * dx + dy * dy + dz * dz
+        dist = np.sqrt(dist_sq)
+        bearing = np.degrees(np.arctan2(dy, dx)) % 360
+        elevation = np.degrees(np.arctan2(dz, np.hypot(dx, dy)))
+        return cls(
+            attackers.heading, attackers.pitch, dist_sq, dist, bearing, elevation
+        )
+
+    def block(self, rows: slice, cols: slice) -> "Engagement":
+        """Return the sub-engagement of ``rows`` attacking ``cols`` as views."""
+        return Engagement(
+            self.heading[rows],
+            self.pitch[rows],
+            self.dist_sq[rows, cols],
+            self.dist[rows, cols],
+            self.bearing[rows, cols],
+            self.elevation[rows, cols],
+        )
+
+    def arc_masks(self, codes: Optional[Iterable[int]] = None) -> np.ndarray:
+        """Boolean ``(len(ARCS), attackers, defenders)`` firing-arc table.
+
+        ``masks[code, i, j]`` is True when defender ``j`` lies in attacker
+        ``i``'s arc ``ARCS[code]``, using the same bounds as ``in_arc()``.
+        Only the arcs listed in ``codes`` (all of them by default) are
+        filled in; the others are left False.
+        """
+        masks = np.zeros((len(ARCS),) + self.bearing.shape, dtype=bool)
+        yaw = pitch = None
+        for code in range(len(ARCS)) if codes is None else codes:
+            arc = ARCS[code]
+            if arc == "omni":
+                masks[code] = True
+            elif arc in ("dorsal", "ventral"):
+                if pitch is None:
+                    pitch = self.elevation - self.pitch[:, None]
+                masks[code] = pitch > 20 if arc == "dorsal" else pitch < -20
+            else:
+                if yaw is None:
+                    yaw = (self.bearing - self.heading[:, None]) % 360
+                if arc == "fore":
+                    masks[code] = (yaw <= 45) | (yaw >= 315)
+                elif arc == "aft":
+                    masks[code] = (yaw >= 135) & (yaw <= 225)
+                elif arc == "port":
+                    masks[code] = (yaw >= 45) & (yaw <= 135)
+                else:
+                    masks[code] = (yaw >= 225) & (yaw <= 315)
+        return masks
@@ -1,7 +1,21 @@
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
-@dataclass
+from .dice import parse_dice
+
+# firing arcs in the order used for arc codes and Engagement.arc_masks()
+ARCS = ("fore", "aft", "port", "starboard", "dorsal", "ventral", "omni")
+ARC_CODES = {arc: code for code, arc in enumerate(ARCS)}
+
+# simple mapping of range bands to maximum distance units
+RANGE_BANDS = {
+    "point": 5.0,
+    "short": 10.0,
+    "standard": 20.0,
+    "long": 40.0,
+}
+
+@dataclass(slots=True)
 class ShipSystem:
     """Represents a single ship subsystem such as engines or shields."""
 
@@ -9,6 +23,10 @@ class ShipSystem:
     efficiency: int = 100
     critical_threshold: int = 50
     effect: str = ""
+    # ship whose damaged-systems cache must be dropped on a status change
+    _owner: Optional["Ship"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def copy(self) -> "ShipSystem":
         return ShipSystem(self.status, self.efficiency, self.critical_threshold)
@@ -20,6 +38,8 @@ class ShipSystem:
             self.status = "Offline"
         elif self.efficiency < self.critical_threshold:
             self.status = "Degraded"
+        if self._owner is not None:
+            self._owner._damaged = None
 
     def repair(self, amount: int) -> None:
         """Repair the system towards full efficiency."""
@@ -27,6 +47,8 @@ class ShipSystem:
             self.efficiency = min(100, self.efficiency + amount)
             if self.efficiency >= self.critical_threshold:
                 self.status = "Operational"
+            if self._owner is not None:
+                self._owner._damaged = None
 
     def __getitem__(self, key: str):
         return getattr(self, key)
@@ -34,7 +56,7 @@ class ShipSystem:
     def __setitem__(self, key: str, value):
         setattr(self, key, value)
 
-@dataclass
+@dataclass(slots=True)
 class WeaponBattery:
     """Individual weapon battery entry."""
 
@@ -45,22 +67,45 @@ class WeaponBattery:
     damage_dice: str = "1d6"
     range: str = "standard"
     special: Optional[str] = None
-
-
-@dataclass
+    _count: int = field(default=0, init=False, repr=False, compare=False)
+    _sides: int = field(default=0, init=False, repr=False, compare=False)
+    _arc_code: int = field(default=0, init=False, repr=False, compare=False)
+    _max_dist_sq: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # arc, range and damage_dice are read once here; see DESIGN_CANVAS.md
+        max_dist = RANGE_BANDS.get(self.range, RANGE_BANDS["standard"])
+        self._max_dist_sq = max_dist * max_dist
+        # unknown arcs are unrestricted, matching in_arc()
+        self._arc_code = ARC_CODES.get(self.arc, ARC_CODES["omni"])
+        # cache the parsed damage roll; zero count means "use rolldice"
+        parsed = parse_dice(self.damage_dice)
+        if parsed is not None:
+            self._count, self._sides = parsed
+
+
+@dataclass(slots=True)
 class WeaponSystem:
     batteries: List[WeaponBattery] = field(default_factory=list)
     missiles: int = 0
+    # per-fit battery arrays built by fleet_arrays.battery_table()
+    _table: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _rating: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._rating = sum(b.rating for b in self.batteries)
 
     @property
     def rating(self) -> int:
         """Aggregate rating of all weapon batteries."""
-        return sum(b.rating for b in self.batteries)
+        return self._rating
 
     def add_battery(self, battery: WeaponBattery) -> None:
         self.batteries.append(battery)
+        self._rating += battery.rating
+        self._table = None
 
-@dataclass
+@dataclass(slots=True)
 class Ship:
     name: str
     hull: int
@@ -84,6 +129,29 @@ class Ship:
     attack_mod: int = 0
     defense_mod: int = 0
     repair_priority: bool = False
+    # (heading, pitch, ux, uy, uz): unit course vector cached by move_fleet()
+    _course: Tuple[float, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _damaged: Optional[List[ShipSystem]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def damaged_systems(self) -> List[ShipSystem]:
+        """Return systems that are not Operational.
+
+        The list is cached and only rebuilt after one of the ship's systems
+        is damaged or repaired; systems added to ``systems`` later are not
+        noticed until then.
+        """
+        if self._damaged is None:
+            damaged = []
+            for system in self.systems.values():
+                system._owner = self
+                if system.status != "Operational":
+                    damaged.append(system)
+            self._damaged = damaged
+        return self._damaged
 
     def __getitem__(self, item: str):
         return getattr(self, item)
@@ -1,4 +1,5 @@
 
+import logging
 import random
 
 from ship_combat.battle_sim import (
@@ -8,8 +9,13 @@ from ship_combat.battle_sim import (
     missile_phase,
     boarding_phase,
     repair_phase,
+    battle,
+    configure_logging,
+    run_round,
+    seed_rng,
 )
-from ship_combat.fleet_setup import new_ship, system_block
+from ship_combat.fleet_arrays import Engagement
+from ship_combat.fleet_setup import demo_fleets, new_ship, system_block
 from ship_combat.models import WeaponSystem, WeaponBattery
 import os
 import sys
@@ -103,3 +109,58 @@ def test_repair_phase_priority():
     assert ship.systems["engines"].efficiency == 50
     assert ship.systems["engines"].status == "Operational"
 
+
+def test_shooting_logs_results(caplog):
+    random.seed(2)
+    attacker = dummy_ship("Attacker")
+    defender = dummy_ship("Defender")
+    with caplog.at_level(logging.INFO, logger="ship_combat"):
+        shooting_phase([attacker], [defender])
+    assert caplog.messages == ["Attacker misses Defender with Gun"]
+
+
+def test_configure_logging_prints_once(capsys, monkeypatch):
+    logger = logging.getLogger("ship_combat")
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "propagate", True)
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [logging.StreamHandler(sys.stdout)])
+    level = logger.level
+    try:
+        configure_logging()
+        logging.getLogger("ship_combat.battle_sim").info("Broadside")
+    finally:
+        logger.setLevel(level)
+    assert capsys.readouterr().out == "Broadside\n"
+
+
+def test_seed_rng_replays_battle():
+    results = []
+    for _ in range(2):
+        seed_rng(7)
+        fleet_a, fleet_b = demo_fleets()
+        battle(fleet_a, fleet_b, rounds=5)
+        results.append([(s.hull, s.order) for s in fleet_a + fleet_b])
+    assert results[0] == results[1]
+
+
+def test_damaged_systems_cache_follows_status():
+    ship = dummy_ship("S")
+    engines = ship.systems["engines"]
+    assert ship.damaged_systems() == []
+    engines.damage(60)
+    assert ship.damaged_systems() == [engines]
+    engines.repair(30)
+    assert ship.damaged_systems() == []
+
+
+def test_round_out_of_reach_skips_geometry(monkeypatch):
+    def no_geometry(*args):
+        raise AssertionError("fleets out of reach should not build an Engagement")
+
+    monkeypatch.setattr(Engagement, "between", no_geometry)
+    for seed in range(20):
+        random.seed(seed)
+        near, far = dummy_ship("Near"), dummy_ship("Far")
+        far.x = 500.0
+        run_round([near], [far], 1)
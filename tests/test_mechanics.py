@@ -1,6 +1,8 @@
 from ship_combat.battle_sim import distance, move_fleet, in_arc, in_range, can_fire
+from ship_combat.dice import parse_dice
+from ship_combat.fleet_arrays import Engagement, FleetArrays
 from ship_combat.fleet_setup import new_ship
-from ship_combat.models import WeaponSystem, WeaponBattery
+from ship_combat.models import ARCS, WeaponSystem, WeaponBattery
 
 
 def dummy_ship(name, x=0.0, y=0.0, z=0.0, heading=0.0, pitch=0.0):
@@ -34,6 +36,14 @@ def test_move_and_distance():
     assert distance(ship, target) == 0
 
 
+def test_move_follows_heading_change():
+    ship = dummy_ship("A")
+    move_fleet([ship])
+    ship.heading = 180.0
+    move_fleet([ship])
+    assert abs(ship.x) < 1e-9 and abs(ship.y) < 1e-9
+
+
 def test_arc_and_range():
     ship = dummy_ship("A", heading=0)
     target = dummy_ship("T", x=5, y=0)
@@ -53,3 +63,56 @@ def test_dorsal_ventral_arcs():
     assert not in_arc(ship, above, "ventral")
     assert in_arc(ship, below, "ventral")
     assert not in_arc(ship, below, "dorsal")
+
+
+def test_parse_dice():
+    assert parse_dice("4d6") == (4, 6)
+    assert parse_dice("d20") == (1, 20)
+    assert parse_dice("2d6+1") is None
+    assert parse_dice("0d6") is None
+
+
+def test_fleet_arrays_columns():
+    ships = [dummy_ship("A", x=1.0), dummy_ship("B", y=2.0, heading=90.0)]
+    fa = FleetArrays.from_ships(ships)
+    assert len(fa) == 2
+    assert fa.x.tolist() == [1.0, 0.0] and fa.y.tolist() == [0.0, 2.0]
+    assert fa.heading.tolist() == [0.0, 90.0]
+    assert fa.ships[1] is ships[1]
+
+
+def test_engagement_matches_scalar_distance():
+    fleet_a = [dummy_ship("A", x=1.0, y=2.0), dummy_ship("B", z=-3.0)]
+    fleet_b = [dummy_ship("C", x=4.0, y=-2.0, z=1.0)]
+    fleet = FleetArrays.from_ships(fleet_a + fleet_b)
+    geometry = Engagement.between(fleet, fleet)
+    eng = geometry.block(slice(None, 2), slice(2, None))
+    back = geometry.block(slice(2, None), slice(None, 2))
+    for i, a in enumerate(fleet_a):
+        for j, b in enumerate(fleet_b):
+            assert eng.dist[i, j] == distance(a, b)
+            assert back.dist[j, i] == distance(b, a)
+
+
+def test_arc_masks_match_in_arc():
+    shooter = dummy_ship("S", heading=30.0, pitch=5.0)
+    targets = [
+        dummy_ship(f"T{k}", x=10.0 * dx, y=10.0 * dy, z=z)
+        for k, (dx, dy, z) in enumerate(
+            [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (1, 1, 9), (1, -1, -9)]
+        )
+    ]
+    eng = Engagement.between(
+        FleetArrays.from_ships([shooter]), FleetArrays.from_ships(targets)
+    )
+    masks = eng.arc_masks()
+    for code, arc in enumerate(ARCS):
+        for j, target in enumerate(targets):
+            assert masks[code, 0, j] == in_arc(shooter, target, arc)
+
+
+def test_weapon_rating_tracks_added_batteries():
+    weapons = WeaponSystem([WeaponBattery("Gun", rating=2)])
+    assert weapons.rating == 2
+    weapons.add_battery(WeaponBattery("Lance", rating=3))
+    assert weapons.rating == 5